@@ -1,4 +1,5 @@
-import pandas as pd
+import math
+
 import numpy as np
 import traceback
 import logging
@@ -17,14 +18,16 @@ def calculate_sharpe_ratio(nav_history, periods_per_year=252):
     """
     if not nav_history or len(nav_history) < 2:
         return 0.0
-    nav_series = pd.Series(nav_history)
-    returns = nav_series.pct_change().dropna()
-    if returns.empty or returns.std() == 0:
+    # Work on a plain float array: one conversion, then NumPy reductions.
+    # This skips the pandas nanops dispatch that pd.Series.pct_change/std go through.
+    nav = np.asarray(nav_history, dtype=np.float64)
+    returns = nav[1:] / nav[:-1] - 1.0
+    std_dev = returns.std(ddof=1)  # match pandas' sample std
+    if returns.size == 0 or std_dev == 0:
         return 0.0
     mean_return = returns.mean()
     annualized_mean_return = mean_return * periods_per_year
-    std_dev = returns.std()
-    annualized_std_dev = std_dev * np.sqrt(periods_per_year)
+    annualized_std_dev = std_dev * math.sqrt(periods_per_year)  # scalar sqrt, no ufunc dispatch
     if annualized_std_dev == 0:
         return 0.0
     sharpe = annualized_mean_return / annualized_std_dev
@@ -32,12 +35,16 @@ def calculate_sharpe_ratio(nav_history, periods_per_year=252):
 # --- End helper function ---
 
 class Engine():
-    def __init__(self, universe: list[str], data_batches: list[list[dict]], strategy_builder, initial_cash=100000.0) -> None:
+    def __init__(self, universe: list[str], data_batches: list[list[dict]], strategy_builder, initial_cash=100000.0,
+                 batch_timesteps: list | None = None) -> None:
         self.initial_cash = initial_cash
         self.universe = universe
 
-        # Store pre-processed data directly
+        # Store pre-processed data directly. Batches no longer carry a
+        # per-batch Clock sentinel dict; the batch timestep travels in the
+        # parallel batch_timesteps list instead.
         self.data_batches = data_batches
+        self.batch_timesteps = batch_timesteps
         self.total_data_points = sum(len(batch) for batch in data_batches)
 
         # Set strategy, portfolio and market
@@ -61,26 +68,37 @@ class Engine():
              return
 
         logger.debug("Running local evlauation...")
-        
+
+        # Resolve hot attributes once instead of once per quote/batch;
+        # these lookups add up over 10^5+ batches.
+        market = self.market
+        portfolio = self.portfolio
+        market_update = market.update
+        on_quote = self.strategy.on_quote
+        net_asset_value = portfolio._net_asset_value
+        record_nav = self.nav_history.append
+
         # --- Iterate directly through pre-processed batches ---
         for quote_batch in self.data_batches:
-            
+
             # 1. Update market with all quotes in the batch
             # (The batch includes quotes for all products at one timestamp)
             for q in quote_batch:
-                self.market.update(q)
+                market_update(q)
 
             # 2. Call the trader's logic ONCE per batch
-            # This mimics the cloud lambda's event-driven approach
+            # This mimics the cloud lambda's event-driven approach.
+            # The try/except deliberately sits at batch level, not per quote,
+            # so the guard is paid once per batch.
             try:
-                self.strategy.on_quote(self.market, self.portfolio)
-            except Exception as e:
+                on_quote(market, portfolio)
+            except Exception:
                 # Log errors locally to help debugging
                 logger.error(f"\n--- ERROR during on_quote ---")
                 traceback.print_exc()
                 logger.error("--------------------------------\n")
                 # Mimic the cloud's behavior of swallowing exceptions
-                pass 
-            
+                pass
+
             # 3. Record NAV history after the batch
-            self.nav_history.append(self.portfolio._net_asset_value())
+            record_nav(net_asset_value())
@@ -13,10 +13,13 @@ import logging
 import sys
 import os
 import importlib.util
-import csv
+import pickle
 import traceback
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 # import own modules
 from src.Engine import calculate_sharpe_ratio, Engine
 
@@ -82,71 +85,104 @@ def enforce_cloud_constraints():
 
 
 # --- CSV Reader Logic ---
-def read_and_batch_csv_data(csv_path: str) -> tuple[list[str], list[list[dict]]]:
+def read_and_batch_csv_data(csv_path: str) -> tuple[list[str], list[list[dict]], list]:
     logger.debug(f"Reading and batching data from: {csv_path}")
-    all_rows = []
+
+    # Strategy iteration reruns this on an unchanged comp_data.csv dozens of
+    # times; cache the batched result in a sidecar keyed by mtime+size so
+    # repeated runs skip the CSV parse entirely.
+    cache_path = csv_path + ".cache.pkl"
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            header_line = f.readline().strip()
-            headers = [h.strip() for h in header_line.split(',')]
-            f.seek(0)
-            reader = csv.DictReader(f)
-            all_rows = list(reader)
+        cache_key = f"{os.path.getmtime(csv_path)}_{os.path.getsize(csv_path)}"
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('key') == cache_key:
+            logger.debug(f"Loaded batched data from cache: {cache_path}")
+            return cached['universe'], cached['batches'], cached['timesteps']
+    except (OSError, pickle.PickleError, EOFError, KeyError, AttributeError):
+        pass  # no/stale/corrupt cache -> fall through and parse
 
+    try:
+        # Read just the header row first, so the long-format parse below can
+        # be restricted to the three columns the engine actually consumes.
+        raw_cols = list(pd.read_csv(csv_path, nrows=0).columns)
+        headers = [str(c).strip() for c in raw_cols]
+        raw_by_name = dict(zip(headers, raw_cols))
         time_col = 'timestep' if 'timestep' in headers else 'timestamp'
-        
+
         if 'product_id' in headers: # LONG FORMAT
-            universe = sorted(list(set(row['product_id'] for row in all_rows)))
-            data_by_product = {ric: [] for ric in universe}
             price_col = 'mid_price'
-            for row in all_rows:
-                 try:
-                    price = float(row[price_col])
-                    ts = row[time_col]
-                    quote = {'id': row['product_id'], 'timestep': ts, 'price': price, 'data': {'Price Close': price}}
-                    data_by_product[row['product_id']].append(quote)
-                 except (ValueError, KeyError): pass
-
-            all_quotes = []
-            for ric in universe: all_quotes.extend(data_by_product[ric])
-            all_quotes.sort(key=lambda q: (q['timestep'], q['id']))
+            # pandas' C parser tokenizes and converts the file natively,
+            # instead of csv.DictReader building one Python dict per row and
+            # float() being called per cell. Any extra columns are never
+            # parsed or held in memory.
+            df = pd.read_csv(csv_path, skipinitialspace=True,
+                             usecols=[raw_by_name[c] for c in (time_col, 'product_id', price_col)])
+            df.columns = [str(c).strip() for c in df.columns]
+            # Unparseable prices become NaN and are dropped, mirroring the
+            # old per-row ValueError skip.
+            df[price_col] = pd.to_numeric(df[price_col], errors='coerce')
+            df = df.dropna(subset=[price_col])
+            universe = sorted(df['product_id'].unique().tolist())
+            # Numeric timesteps now sort numerically instead of
+            # lexicographically as strings.
+            df = df.sort_values([time_col, 'product_id'], kind='stable')
+
+            # Find batch boundaries vectorized: one comparison pass over the
+            # timestep column instead of a per-row Python compare.
+            ts_arr = df[time_col].to_numpy()
+            timesteps = df[time_col].tolist()
+            # Interned ids: every quote for a product shares one string
+            # object, so downstream dict probes compare by identity.
+            ids = [sys.intern(i) if isinstance(i, str) else i for i in df['product_id'].tolist()]
+            prices = df[price_col].tolist()
+            del df  # free the frame before the quote dicts are built
 
             batched_data = []
-            current_batch = []
-            last_ts = None
-            for quote in all_quotes:
-                ts = quote['timestep']
-                if last_ts is None: last_ts = ts
-                if ts != last_ts:
-                    if current_batch:
-                         current_batch.append({'id': 'Clock', 'timestep': last_ts})
-                         batched_data.append(current_batch)
-                    current_batch = [quote]
-                    last_ts = ts
-                else:
-                    current_batch.append(quote)
-            if current_batch:
-                 current_batch.append({'id': 'Clock', 'timestep': last_ts})
-                 batched_data.append(current_batch)
+            batch_timesteps = []
+            if len(ts_arr):
+                change = np.flatnonzero(ts_arr[1:] != ts_arr[:-1]) + 1
+                starts = np.concatenate(([0], change))
+                stops = np.concatenate((change, [len(ts_arr)]))
+                for start, stop in zip(starts.tolist(), stops.tolist()):
+                    ts = timesteps[start]
+                    batched_data.append([
+                        {'id': ids[i], 'timestep': ts, 'price': prices[i], 'data': {'Price Close': prices[i]}}
+                        for i in range(start, stop)
+                    ])
+                    batch_timesteps.append(ts)
 
         else: # WIDE FORMAT
             universe = sorted([h for h in headers if h != time_col])
+            df = pd.read_csv(csv_path, skipinitialspace=True)
+            df.columns = [str(c).strip() for c in df.columns]
+            # One numeric conversion per column; empty/invalid cells become
+            # NaN and are skipped below.
+            price_cols = [pd.to_numeric(df[ric], errors='coerce').tolist() for ric in universe]
+            row_timesteps = df[time_col].tolist()
+            del df  # free the frame before the quote dicts are built
             batched_data = []
-            for row in all_rows:
-                ts = row.get(time_col)
+            batch_timesteps = []
+            for i, ts in enumerate(row_timesteps):
                 current_batch = []
-                for ric in universe:
-                    if row.get(ric) and row[ric] not in ('', 'NaN'):
-                        try:
-                            price = float(row[ric])
-                            quote = {'id': ric, 'timestep': ts, 'price': price, 'data': {'Price Close': price}}
-                            current_batch.append(quote)
-                        except ValueError: pass
+                for ric, col in zip(universe, price_cols):
+                    price = col[i]
+                    if price == price:  # not NaN
+                        current_batch.append({'id': ric, 'timestep': ts, 'price': price, 'data': {'Price Close': price}})
                 if current_batch:
-                    current_batch.append({'id': 'Clock', 'timestep': ts})
                     batched_data.append(current_batch)
+                    batch_timesteps.append(ts)
+
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump({'key': cache_key, 'universe': universe,
+                             'batches': batched_data, 'timesteps': batch_timesteps},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            logger.debug(f"Wrote batch cache: {cache_path}")
+        except OSError:
+            logger.debug(f"Could not write batch cache: {cache_path}")
 
-        return universe, batched_data
+        return universe, batched_data, batch_timesteps
     except Exception as e:
         print(f"ERROR: Failed to process CSV file {csv_path}: {e}")
         sys.exit(1)
@@ -202,11 +238,12 @@ if __name__ == "__main__":
          sys.exit(1)
 
     strategy_builder_func = load_submission(submission_path)
-    universe, data_batches = read_and_batch_csv_data(data_path)
+    universe, data_batches, batch_timesteps = read_and_batch_csv_data(data_path)
 
     try:
         # Pass universe to the builder (Fixes the signature mismatch)
-        engine = Engine(universe, data_batches, strategy_builder_func, initial_cash=100000.0)
+        engine = Engine(universe, data_batches, strategy_builder_func, initial_cash=100000.0,
+                        batch_timesteps=batch_timesteps)
         engine.run()
     except Exception as e:
         print(f"\n--- ERROR during Engine Run ---")
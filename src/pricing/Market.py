@@ -1,11 +1,30 @@
+import sys
+
+import numpy as np
+
+
 class Market():
     def __init__(self: "Market", universe: list[str]) -> None:
-        self.universe: list[str] = universe
+        # Interned ids let the per-quote dict probes below take the
+        # pointer-identity fast path instead of re-hashing the string.
+        self.universe: list[str] = [sys.intern(r) if isinstance(r, str) else r for r in universe]
         self.quotes: dict[str, dict] = {}  # {key: product, value: {key: timestep, value: price}}
-        
-    def update(self: "Market", quote: dict)-> None:
+        # Integer slot per product plus a packed price vector. The dict of
+        # quote dicts stays the public interface; the vector is what the
+        # Portfolio hot path (NAV every batch) reads.
+        self._idx: dict[str, int] = {ric: i for i, ric in enumerate(universe)}
+        self._prices: np.ndarray = np.zeros(len(universe))
+        self._timesteps: list = [None] * len(universe)
+        self._has_quote: np.ndarray = np.zeros(len(universe), dtype=bool)
+
+    def update(self: "Market", quote: dict) -> None:
         if quote['id'] != "Clock":
             self.quotes[quote['id']] = quote
+            i = self._idx.get(quote['id'])
+            if i is not None:
+                self._prices[i] = quote['price']
+                self._timesteps[i] = quote.get('timestep')
+                self._has_quote[i] = True
 
     def __str__(self: "Market") -> str:
-        return str(self.quotes)
\ No newline at end of file
+        return str(self.quotes)
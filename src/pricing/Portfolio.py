@@ -9,6 +9,9 @@ Date: 2025-11-02
 """
 
 import logging
+
+import numpy as np
+
 from pricing.Market import Market
 
 logger = logging.getLogger("local_eval")
@@ -19,15 +22,29 @@ class Portfolio():
         self.market: Market = market
         self.positions: dict[str, int] = {}  # key: product, value: quantity
         self.leverage_limit: float = leverage_limit  # max leverage allowed
+        # Quantity vector aligned with market._prices so NAV is a single dot
+        # product instead of a per-position dict walk every batch. Set to
+        # None (dict-walk fallback) if a product outside the universe is traded.
+        self._qty: np.ndarray | None = np.zeros(len(market.universe))
 
     def _get_price(self, product: str) -> float:
         """Retrieve the last market price for a given product."""
+        i = self.market._idx.get(product)
+        if i is not None:  # packed slot: one index instead of two dict probes
+            if not self.market._has_quote[i]:
+                raise ValueError(f"No quote available for {product}")
+            return float(self.market._prices[i])
         if product not in self.market.quotes:
             raise ValueError(f"No quote available for {product}")
         return self.market.quotes[product].get("price", None)
-    
+
     def _get_timestep(self, product) -> int:
         """Retrieve the current market timestep for the product quote."""
+        i = self.market._idx.get(product)
+        if i is not None:
+            if not self.market._has_quote[i]:
+                raise ValueError(f"No quote available for {product}")
+            return self.market._timesteps[i]
         if product not in self.market.quotes:
             raise ValueError(f"No quote available for {product}")
         return self.market.quotes[product].get("timestep", None)
@@ -40,8 +57,20 @@ class Portfolio():
             total += abs(qty) * price
         return total
 
+    def _sync_position(self, product: str) -> None:
+        """Keep the quantity vector in sync with the positions dict."""
+        if self._qty is None:
+            return
+        i = self.market._idx.get(product)
+        if i is None:
+            self._qty = None  # off-universe product: NAV falls back to the dict walk
+        else:
+            self._qty[i] = self.positions.get(product, 0)
+
     def _net_asset_value(self) -> float:
         """Compute portfolio net asset value = cash + sum(qty * price)"""
+        if self._qty is not None:
+            return self.cash + float(self._qty @ self.market._prices)
         value = self.cash
         for product, qty in self.positions.items():
             price = self._get_price(product)
@@ -77,6 +106,7 @@ class Portfolio():
 
         self.cash = new_cash
         self.positions = new_positions
+        self._sync_position(product)
         logger.info(f"{timestep} | BOUGHT {quantity} {product} @ {price} | new cash={self.cash:.2f}")
         return True
 
@@ -96,6 +126,7 @@ class Portfolio():
 
         self.cash = new_cash
         self.positions = new_positions
+        self._sync_position(product)
         logger.info(f"{timestep} | SOLD {quantity} {product} @ {price} | new cash={self.cash:.2f}")
         return True
 
@@ -60,6 +60,15 @@ def test_short_exceed_leverage(portfolio):
     assert "AAPL" not in portfolio.positions or portfolio.positions["AAPL"] == 0
 
 
+def test_nav_consistent_for_off_universe_product(market):
+    """Trading a quoted product outside the universe must not break NAV."""
+    market.update({"id": "MSFT", "price": 50})  # quoted, but not in universe
+    p = Portfolio(10000, market, leverage_limit=2.0)
+    assert p.buy("MSFT", 10) is True
+    # Buying at the mark leaves net value unchanged (cash swapped for stock)
+    assert pytest.approx(p.summary()["net_value"]) == 10000
+
+
 # --- New Test Case for Combined Long and Short Positions ---
 
 @pytest.fixture
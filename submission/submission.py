@@ -10,6 +10,7 @@ except ImportError:
     class Portfolio: pass
 
 import logging
+import sys
 logger = logging.getLogger("local_eval")
 
 class TestTrader:
@@ -17,28 +18,44 @@ class TestTrader:
         logger.debug("TestTrader initialized.")
         self.universe = universe
         self.fast_window = 5
-        self.slow_window = 50 
+        self.slow_window = 50
         self.base_size = 100
         self.history = []
+        # Running window sums so each MA is O(1) per tick instead of
+        # re-slicing and re-summing the history list.
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+        # Interned keys resolved once; the per-tick quote lookups then hit
+        # the dict's identity fast path.
+        self._interest_key = sys.intern("INTERESTingProduct")
+        self._fund_key = sys.intern("James_Fund_007")
 
     def on_quote(self, market: Market, portfolio: Portfolio) -> None:
-        # Check if required products exist
-        if "INTERESTingProduct" not in market.quotes or "James_Fund_007" not in market.quotes:
+        # Check if required products exist and fetch them in one .get each
+        # (instead of an `in` probe followed by a second lookup per product)
+        quotes = market.quotes
+        quote_interest = quotes.get(self._interest_key)
+        quote_fund = quotes.get(self._fund_key)
+        if quote_interest is None or quote_fund is None:
             return
 
-        # Get latest prices
-        quote_interest = market.quotes["INTERESTingProduct"]["price"]
-        quote_fund = market.quotes["James_Fund_007"]["price"]
-
-        # Save data
-        self.history.append(quote_interest)
+        # Save latest price and roll the window sums forward
+        price = quote_interest["price"]
+        self.history.append(price)
+        n = len(self.history)
+        self._fast_sum += price
+        if n > self.fast_window:
+            self._fast_sum -= self.history[-self.fast_window - 1]
+        self._slow_sum += price
+        if n > self.slow_window:
+            self._slow_sum -= self.history[-self.slow_window - 1]
 
         # Need enough points for both MAs
-        if len(self.history) < self.slow_window:
+        if n < self.slow_window:
             return
-        
-        fast_ma = sum(self.history[-self.fast_window:]) / self.fast_window
-        slow_ma = sum(self.history[-self.slow_window:]) / self.slow_window
+
+        fast_ma = self._fast_sum / self.fast_window
+        slow_ma = self._slow_sum / self.slow_window
 
         # --- MOMENTUM LOGIC ---
 
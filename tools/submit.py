@@ -25,13 +25,31 @@ with the S3 trigger (evaluation starts when `submission.py` appears).
 """
 
 import os, sys, time, importlib.util, traceback, types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from dotenv import load_dotenv
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, NoCredentialsError, ClientError
 
+# Connection pool sized for concurrent uploads; adaptive retries back off
+# instead of hammering S3 on throttles, keepalive avoids TLS re-handshakes.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=16,
+    retries={"mode": "adaptive", "max_attempts": 3},
+    tcp_keepalive=True,
+)
+
+# Large files (model artifacts etc.) go up as parallel multipart PUTs.
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
 load_dotenv()
 REQUIRED_ENVS = ["AWS_REGION", "SUBMISSIONS_BUCKET", "PARTICIPANT_ID"]
 
@@ -159,7 +177,7 @@ def main():
         print("[submit] Please fix the issues above and try again.")
         sys.exit(1)
 
-    s3 = boto3.client("s3", region_name=region)
+    s3 = boto3.client("s3", region_name=region, config=S3_CLIENT_CONFIG)
 
     # Collect files; upload everything except submission.py first
     files = [p for p in src_dir.rglob("*") if p.is_file()]
@@ -176,14 +194,18 @@ def main():
         key = prefix + rel
         extra = {}
         try:
-            s3.upload_file(str(path), bucket, key, ExtraArgs=extra)
+            s3.upload_file(str(path), bucket, key, ExtraArgs=extra, Config=S3_TRANSFER_CONFIG)
             print(f"[submit] uploaded s3://{bucket}/{key}")
         except (BotoCoreError, ClientError, NoCredentialsError) as e:
             die(f"Failed to upload {path}: {e}")
 
     print(f"[submit] Uploading to s3://{bucket}/{prefix}")
-    for p in files_non_trigger:
-        upload(p)
+    # Upload the non-trigger files in parallel; the pool is fully drained
+    # before submission.py goes up, so the race-avoidance ordering
+    # (evaluation starts when submission.py appears) is preserved.
+    if files_non_trigger:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(upload, files_non_trigger))
 
     # Upload trigger last
     upload(file_trigger[0])